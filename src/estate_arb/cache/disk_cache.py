@@ -0,0 +1,69 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from diskcache import Cache
+
+
+class DiskCache:
+    """Persistent TTL cache for eBay price stats, backed by SQLite via diskcache.
+
+    A small in-memory LRU sits in front of the disk store so repeat lookups
+    within a run never touch SQLite.
+    """
+
+    def __init__(
+        self,
+        ttl_hours: float = 24,
+        path: str = ".cache/ebay",
+        size_limit: int = 512 * 1024 * 1024,
+        max_memory_entries: int = 4096,
+    ):
+        self.ttl_hours = ttl_hours
+        self.max_memory_entries = max_memory_entries
+        self._cache = Cache(
+            path,
+            size_limit=size_limit,
+            eviction_policy="least-recently-used",
+        )
+        # key -> (expire_ts, value); expire_ts is None when the TTL is unknown
+        self._mem: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+
+    @staticmethod
+    def _key(query: str) -> str:
+        """Short, stable key for a search query."""
+        return hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _remember(self, key: str, expire_ts: float | None, value: Any):
+        self._mem[key] = (expire_ts, value)
+        self._mem.move_to_end(key)
+        if len(self._mem) > self.max_memory_entries:
+            self._mem.popitem(last=False)
+
+    def get(self, query: str) -> Any | None:
+        """Return the cached value for a query, or None if missing/expired."""
+        key = self._key(query)
+        entry = self._mem.get(key)
+        if entry is not None:
+            expire_ts, value = entry
+            if expire_ts is None or expire_ts > time.time():
+                self._mem.move_to_end(key)
+                return value
+            del self._mem[key]
+            return None
+
+        value, expire_ts = self._cache.get(key, expire_time=True)
+        if value is not None:
+            self._remember(key, expire_ts, value)
+        return value
+
+    def set(self, query: str, value: Any):
+        """Store a value for a query, expiring after ttl_hours."""
+        key = self._key(query)
+        ttl = self.ttl_hours * 3600
+        self._cache.set(key, value, expire=ttl)
+        self._remember(key, time.time() + ttl, value)
+
+    def close(self):
+        self._cache.close()
@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import functools
 import logging
 import os
 import sys
@@ -12,6 +13,7 @@ if sys.platform == "win32":
     if hasattr(sys.stderr, "reconfigure"):
         sys.stderr.reconfigure(encoding="utf-8")
 
+import aiohttp
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
@@ -29,30 +31,48 @@ import re as _re
 import subprocess
 
 
+_PARENS_RE = _re.compile(r"\(.*?\)")
+_QUERY_NOISE = frozenset({
+    "vintage", "antique", "original", "authentic", "genuine", "classic",
+    "various", "unknown", "with", "and", "the", "for", "from", "set",
+    "collection", "collectible", "collectibles", "style", "type",
+})
+
+
+@functools.lru_cache(maxsize=2048)
 def _simplify_query(brand: str, item_type: str) -> str:
     """Turn a verbose vision description into a short eBay search query."""
     # Drop "Unknown" brand
     brand_part = "" if not brand or brand.lower() == "unknown" else brand
     # Strip parenthetical details and slash-alternatives
-    simple = _re.sub(r"\(.*?\)", "", item_type)
+    simple = _PARENS_RE.sub("", item_type)
     simple = simple.split("/")[0]
     # Remove brand name from item_type to avoid duplication
     if brand_part:
         simple = _re.sub(_re.escape(brand_part), "", simple, flags=_re.IGNORECASE)
     # Drop noise words
     words = simple.split()
-    noise = {
-        "vintage", "antique", "original", "authentic", "genuine", "classic",
-        "various", "unknown", "with", "and", "the", "for", "from", "set",
-        "collection", "collectible", "collectibles", "style", "type",
-    }
-    core = [w for w in words if w.lower() not in noise]
+    core = [w for w in words if w.lower() not in _QUERY_NOISE]
     core = core[:3] if core else words[:2]
     suffix = " ".join(core).strip()
     query = f"{brand_part} {suffix}".strip()
     if len(query) > 50:
         query = query[:50].rsplit(" ", 1)[0]
     return query
+
+
+def _build_query(
+    item: SaleItem, brands_by_name: dict[str, BrandConfig]
+) -> tuple[str, float]:
+    """Return the eBay search query and minimum median price for an item."""
+    brand_config = brands_by_name.get(item.brand)
+    if brand_config:
+        suffix = brand_config.ebay_search_suffix
+        query = f"{item.brand} {suffix}".strip()
+        return query, brand_config.min_ebay_price
+    # Vision-discovered: use ebay_query if available
+    query = item.ebay_query or _simplify_query(item.brand, item.item_type)
+    return query, 15
 from .output.terminal import TerminalOutput
 
 logger = logging.getLogger(__name__)
@@ -73,132 +93,214 @@ async def run(args):
     matcher = BrandMatcher(brands)
     cache = DiskCache(ttl_hours=settings.cache_ttl_hours)
     output = TerminalOutput()
-    vision = PhotoAnalyzer(
-        region=settings.aws_region,
-        model_id=settings.bedrock_model_id,
-        max_photos_per_batch=10,
-    )
+    vision = None
 
     console.print()
     console.print(f"[bold green]Estate Sale Arbitrage Scanner[/bold green]")
     console.print(f"[dim]Searching near ZIP {zip_code} | Min profit: {multiplier}x[/dim]")
     console.print()
 
-    # ── Phase 1: Scrape estate sales ──
-    console.print("[bold]Phase 1:[/bold] Searching EstateSales.net...")
-    async with EstateSalesScraper(
-        delay=settings.request_delay_seconds,
-        headless=headless,
-        user_agent=settings.user_agent,
-    ) as es_scraper:
-        sales = await es_scraper.search_sales(
-            zip_code=zip_code,
-            state=state,
-            city=city,
-            max_sales=settings.max_estate_sales,
-        )
-        console.print(f"  Found [bold]{len(sales)}[/bold] local estate sales [dim](online auctions filtered out)[/dim]")
-
-        if not sales:
-            console.print("[yellow]No estate sales found. Try a different ZIP or wider area.[/yellow]")
-            return
-
-        # Enrich each sale with descriptions and photos
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("{task.completed}/{task.total}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Loading sale details...", total=len(sales))
-            for sale in sales:
-                await es_scraper.enrich_sale(sale)
-                progress.advance(task)
-
-    # ── Phase 2: Text-based brand matching ──
-    console.print("\n[bold]Phase 2:[/bold] Scanning descriptions for target brands...")
-    matched_sales = []
-    for sale in sales:
-        items = matcher.match_sale(sale)
-        if items:
-            sale.matched_items = items
-            matched_sales.append(sale)
-    console.print(
-        f"  [bold]{len(matched_sales)}[/bold] sales with text-based brand matches"
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total}"),
+        console=console,
     )
-
-    # ── Phase 3: AI Vision analysis ──
-    vision_finds = 0
-    if not args.no_vision:
-        console.print("\n[bold]Phase 3:[/bold] AI Vision scanning photos for hidden gems...")
-
-        # Analyze photos for ALL sales (not just text matches)
-        # This is where we find the Qiviut sweaters and hidden gold
-        sales_with_photos = [s for s in sales if s.photo_urls]
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("{task.completed}/{task.total}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(
-                "Analyzing photos with Claude Vision...",
-                total=len(sales_with_photos),
+    try:
+        # One live display for every phase so later phases can add tasks to it
+        with progress:
+            # ── Phase 1: Scrape estate sales ──
+            console.print("[bold]Phase 1:[/bold] Searching EstateSales.net...")
+            async with EstateSalesScraper(
+                delay=settings.request_delay_seconds,
+                headless=headless,
+                user_agent=settings.user_agent,
+            ) as es_scraper:
+                sales = await es_scraper.search_sales(
+                    zip_code=zip_code,
+                    state=state,
+                    city=city,
+                    max_sales=settings.max_estate_sales,
+                )
+                console.print(f"  Found [bold]{len(sales)}[/bold] local estate sales [dim](online auctions filtered out)[/dim]")
+
+                if not sales:
+                    console.print("[yellow]No estate sales found. Try a different ZIP or wider area.[/yellow]")
+                    return
+
+                # Enrich each sale with descriptions and photos
+                task = progress.add_task("Loading sale details...", total=len(sales))
+                # Sales share one browser, so cap in-flight detail pages
+                await es_scraper.enrich_sales(
+                    sales,
+                    concurrency=settings.max_concurrency,
+                    on_enriched=lambda _sale: progress.advance(task),
+                )
+
+            # ── Phase 2: Text-based brand matching ──
+            console.print("\n[bold]Phase 2:[/bold] Scanning descriptions for target brands...")
+            matched_sales = []
+            for sale in sales:
+                items = matcher.match_sale(sale)
+                if items:
+                    sale.matched_items = items
+                    matched_sales.append(sale)
+            console.print(
+                f"  [bold]{len(matched_sales)}[/bold] sales with text-based brand matches"
             )
-            for sale in sales_with_photos:
-                try:
-                    vision_items = await vision.analyze_sale_photos(
-                        sale.photo_urls,
-                        max_photos=settings.max_photos_per_sale,
-                    )
 
-                    for vi in vision_items:
-                        brand = vi.get("brand", "Unknown")
-                        item_type = vi.get("item_type", "")
-                        ebay_query = vi.get("ebay_query", "")
-                        est_low = vi.get("estimated_value_low", 0)
-                        est_high = vi.get("estimated_value_high", 0)
-                        confidence = vi.get("confidence", 0.5)
-                        reasoning = vi.get("reasoning", "")
-
-                        # Check if this brand was already found via text
-                        existing = [
-                            it for it in sale.matched_items if it.brand == brand
-                        ]
-                        if existing:
-                            existing[0].source = "both"
-                            existing[0].reasoning = reasoning
-                            continue
-
-                        # New vision-only find
-                        sale_item = SaleItem(
-                            brand=brand,
-                            description=f"{item_type} (identified by AI vision)",
-                            confidence=confidence,
-                            source="vision",
-                            item_type=item_type,
-                            reasoning=reasoning,
-                            ebay_query=ebay_query,
-                        )
-                        sale.matched_items.append(sale_item)
-                        vision_finds += 1
-
-                        if sale not in matched_sales:
-                            matched_sales.append(sale)
-                except Exception as e:
-                    logger.warning(f"Vision analysis failed for '{sale.title}': {e}")
-
-                progress.advance(task)
+            # ── Phase 3 + 4: AI Vision analysis overlapped with eBay lookups ──
+            # Text matches already know their eBay queries, so their lookups start
+            # right away and run while Vision is still scanning photos.
+            vision_finds = 0
+            if not args.no_vision:
+                console.print("\n[bold]Phase 3:[/bold] AI Vision scanning photos for hidden gems...")
+                # Analyze photos for ALL sales (not just text matches)
+                # This is where we find the Qiviut sweaters and hidden gold
+                sales_with_photos = [s for s in sales if s.photo_urls]
+            else:
+                console.print("\n[dim]Phase 3: AI Vision skipped (--no-vision flag)[/dim]")
+                sales_with_photos = []
+            console.print("[bold]Phase 4:[/bold] Cross-referencing eBay sold prices...")
+            opportunities: list[ArbitrageOpportunity] = []
+
+            # One pooled HTTP session for every photo download in the run
+            http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20),
+                timeout=aiohttp.ClientTimeout(**settings.http_timeouts),
+            )
+            vision = PhotoAnalyzer(
+                region=settings.aws_region,
+                model_id=settings.bedrock_model_id,
+                max_photos_per_batch=20,
+                http_session=http_session,
+                max_concurrent_requests=settings.bedrock_concurrency,
+            )
 
+            async with http_session, EbaySoldScraper(
+                delay=settings.ebay_request_delay_seconds,
+                headless=headless,
+                user_agent=settings.user_agent,
+                page_concurrency=settings.ebay_page_concurrency,
+            ) as ebay_scraper:
+                ebay_task = progress.add_task("Looking up eBay sold prices...", total=0)
+                ebay_sem = asyncio.Semaphore(settings.ebay_concurrency)
+                # Many items share a query (same brand + suffix), so fetch each once
+                lookups: dict[str, asyncio.Task] = {}
+
+                async def _fetch(query):
+                    async with ebay_sem:
+                        # Check cache first
+                        cached = cache.get(query)
+                        if cached and not args.no_cache:
+                            stats = cached
+                        else:
+                            batch = await ebay_scraper.search_sold(
+                                query, max_pages=settings.max_ebay_pages
+                            )
+                            stats = PriceAnalyzer.analyze(batch.prices)
+                            cache.set(query, stats)
+                    progress.advance(ebay_task)
+                    return stats
+
+                def _start_lookups():
+                    for sale in matched_sales:
+                        for item in sale.matched_items:
+                            query, _ = _build_query(item, brands_by_name)
+                            if query not in lookups:
+                                lookups[query] = asyncio.create_task(_fetch(query))
+                    progress.update(ebay_task, total=len(lookups))
+
+                _start_lookups()
+
+                if sales_with_photos:
+                    vision_task = progress.add_task(
+                        "Analyzing photos with Claude Vision...",
+                        total=len(sales_with_photos),
+                    )
+                    # Several sales share one request so the long prompt is sent once
+                    per_batch = settings.vision_sales_per_batch
+                    chunks = [
+                        sales_with_photos[i : i + per_batch]
+                        for i in range(0, len(sales_with_photos), per_batch)
+                    ]
+
+                    async def _vision(chunk):
+                        # The analyzer bounds its own downloads and Bedrock calls
+                        try:
+                            per_sale = await vision.analyze_sales_batch(
+                                chunk,
+                                max_photos_per_sale=settings.max_photos_per_sale,
+                                max_sales_per_batch=per_batch,
+                            )
+                        except Exception as e:
+                            logger.warning(f"Vision analysis failed for {len(chunk)} sales: {e}")
+                            per_sale = [[] for _ in chunk]
+                        progress.advance(vision_task, len(chunk))
+                        return list(zip(chunk, per_sale))
+
+                    results = [
+                        pair
+                        for chunk_results in await asyncio.gather(*[_vision(c) for c in chunks])
+                        for pair in chunk_results
+                    ]
+
+                    # Merge results serially so matched_sales is only mutated in one place
+                    matched_ids = {s.sale_id for s in matched_sales}
+                    for sale, vision_items in results:
+                        by_brand = {it.brand: it for it in sale.matched_items}
+                        for vi in vision_items:
+                            brand = vi.get("brand", "Unknown")
+                            item_type = vi.get("item_type", "")
+                            ebay_query = vi.get("ebay_query", "")
+                            est_low = vi.get("estimated_value_low", 0)
+                            est_high = vi.get("estimated_value_high", 0)
+                            confidence = vi.get("confidence", 0.5)
+                            reasoning = vi.get("reasoning", "")
+
+                            # Check if this brand was already found via text
+                            existing = by_brand.get(brand)
+                            if existing:
+                                existing.source = "both"
+                                existing.reasoning = reasoning
+                                continue
+
+                            # New vision-only find
+                            sale_item = SaleItem(
+                                brand=brand,
+                                description=f"{item_type} (identified by AI vision)",
+                                confidence=confidence,
+                                source="vision",
+                                item_type=item_type,
+                                reasoning=reasoning,
+                                ebay_query=ebay_query,
+                            )
+                            sale.matched_items.append(sale_item)
+                            by_brand[brand] = sale_item
+                            vision_finds += 1
+
+                            if sale.sale_id not in matched_ids:
+                                matched_ids.add(sale.sale_id)
+                                matched_sales.append(sale)
+
+                    # Look up queries for the vision finds; already-running
+                    # lookups from the text matches are reused
+                    _start_lookups()
+
+                stats_by_query = dict(
+                    zip(lookups, await asyncio.gather(*lookups.values()))
+                )
+    finally:
+        if vision is not None:
+            await vision.close()
+        cache.close()
+
+    if sales_with_photos:
         console.print(
             f"  AI Vision found [bold magenta]{vision_finds}[/bold magenta] "
             f"additional items not in descriptions"
         )
-    else:
-        console.print("\n[dim]Phase 3: AI Vision skipped (--no-vision flag)[/dim]")
 
     if not matched_sales:
         console.print(
@@ -207,85 +309,40 @@ async def run(args):
         )
         return
 
-    # ── Phase 4: eBay price cross-reference ──
-    console.print("\n[bold]Phase 4:[/bold] Cross-referencing eBay sold prices...")
-    opportunities: list[ArbitrageOpportunity] = []
-
-    async with EbaySoldScraper(
-        delay=settings.ebay_request_delay_seconds,
-        headless=headless,
-        user_agent=settings.user_agent,
-    ) as ebay_scraper:
-        total_items = sum(len(s.matched_items) for s in matched_sales)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("{task.completed}/{task.total}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(
-                "Looking up eBay sold prices...", total=total_items
-            )
-
-            for sale in matched_sales:
-                for item in sale.matched_items:
-                    # Build eBay search query
-                    brand_config = brands_by_name.get(item.brand)
-                    if brand_config:
-                        suffix = brand_config.ebay_search_suffix
-                        min_price = brand_config.min_ebay_price
-                        query = f"{item.brand} {suffix}".strip()
-                    else:
-                        # Vision-discovered: use ebay_query if available
-                        min_price = 15
-                        query = item.ebay_query or _simplify_query(
-                            item.brand, item.item_type
-                        )
-
-                    # Check cache first
-                    cached = cache.get(query)
-                    if cached and not args.no_cache:
-                        stats = cached
-                    else:
-                        listings = await ebay_scraper.search_sold(
-                            query, max_pages=settings.max_ebay_pages
-                        )
-                        stats = PriceAnalyzer.analyze(listings)
-                        cache.set(query, stats)
-
-                    if stats["count"] > 0 and stats["median"] >= min_price:
-                        profit_mult = None
-                        if item.estimated_price and item.estimated_price > 0:
-                            profit_mult = stats["median"] / item.estimated_price
-
-                        opp = ArbitrageOpportunity(
-                            estate_sale_title=sale.title,
-                            estate_sale_url=sale.url,
-                            estate_sale_dates=sale.dates,
-                            estate_sale_location=(
-                                f"{sale.city}, {sale.state} {sale.zip_code}".strip(", ")
-                            ),
-                            matched_brand=item.brand,
-                            matched_description=item.description,
-                            detection_source=item.source,
-                            estate_price_estimate=item.estimated_price,
-                            ebay_median_sold=stats["median"],
-                            ebay_average_sold=stats["average"],
-                            ebay_sample_count=stats["count"],
-                            ebay_price_range=(stats["min"], stats["max"]),
-                            profit_multiplier=profit_mult,
-                            photo_urls=item.photo_urls,
-                            item_type=item.item_type,
-                            vision_reasoning=item.reasoning,
-                        )
-
-                        # Include if: no estate price known, or meets multiplier threshold
-                        if profit_mult is None or profit_mult >= multiplier:
-                            opportunities.append(opp)
-
-                    progress.advance(task)
+    for sale in matched_sales:
+        for item in sale.matched_items:
+            query, min_price = _build_query(item, brands_by_name)
+            stats = stats_by_query[query]
+
+            if stats["count"] > 0 and stats["median"] >= min_price:
+                profit_mult = None
+                if item.estimated_price and item.estimated_price > 0:
+                    profit_mult = stats["median"] / item.estimated_price
+
+                opp = ArbitrageOpportunity(
+                    estate_sale_title=sale.title,
+                    estate_sale_url=sale.url,
+                    estate_sale_dates=sale.dates,
+                    estate_sale_location=(
+                        f"{sale.city}, {sale.state} {sale.zip_code}".strip(", ")
+                    ),
+                    matched_brand=item.brand,
+                    matched_description=item.description,
+                    detection_source=item.source,
+                    estate_price_estimate=item.estimated_price,
+                    ebay_median_sold=stats["median"],
+                    ebay_average_sold=stats["average"],
+                    ebay_sample_count=stats["count"],
+                    ebay_price_range=(stats["min"], stats["max"]),
+                    profit_multiplier=profit_mult,
+                    photo_urls=item.photo_urls,
+                    item_type=item.item_type,
+                    vision_reasoning=item.reasoning,
+                )
+
+                # Include if: no estate price known, or meets multiplier threshold
+                if profit_mult is None or profit_mult >= multiplier:
+                    opportunities.append(opp)
 
     # ── Phase 5: Output results ──
     output.display_summary(
@@ -385,8 +442,15 @@ def main():
     logging.getLogger("playwright").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
+    # uvloop (libuv) dispatches socket readiness faster than the default loop
+    if sys.platform != "win32":
+        import uvloop
+        runner = uvloop.run
+    else:
+        runner = asyncio.run
+
     try:
-        asyncio.run(run(args))
+        runner(run(args))
     except KeyboardInterrupt:
         Console().print("\n[yellow]Scan cancelled.[/yellow]")
         sys.exit(0)
@@ -1,9 +1,11 @@
-import json
-from dataclasses import dataclass, field
+import functools
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class BrandConfig:
     name: str
     category: str
@@ -12,7 +14,7 @@ class BrandConfig:
     min_ebay_price: float = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     zip_code: str = "10001"
     radius_miles: int = 30
@@ -23,7 +25,16 @@ class Settings:
     cache_ttl_hours: float = 24
     request_delay_seconds: float = 2.0
     ebay_request_delay_seconds: float = 3.0
+    max_concurrency: int = 8
+    bedrock_concurrency: int = 5
+    vision_sales_per_batch: int = 4
+    ebay_concurrency: int = 3
+    ebay_page_concurrency: int = 4
     headless_browser: bool = True
+    # aiohttp.ClientTimeout arguments for the shared HTTP session
+    http_timeouts: dict[str, float] = field(
+        default_factory=lambda: {"total": 30.0, "connect": 5.0, "sock_read": 15.0}
+    )
     aws_region: str = "us-east-1"
     bedrock_model_id: str = "us.anthropic.claude-sonnet-4-20250514-v1:0"
     user_agent: str = (
@@ -32,14 +43,23 @@ class Settings:
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int):
+    """Parse a JSON file, cached until its mtime changes.
+
+    The parsed data is shared between callers; treat it as read-only.
+    """
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
 def load_brands(path: str = "config/brands.json") -> list[BrandConfig]:
     """Load brand configurations from JSON file."""
     filepath = Path(path)
     if not filepath.exists():
         raise FileNotFoundError(f"Brands config not found: {filepath}")
 
-    with open(filepath) as f:
-        data = json.load(f)
+    data = _load_json(str(filepath), filepath.stat().st_mtime_ns)
 
     brands = []
     for entry in data["brands"]:
@@ -47,7 +67,7 @@ def load_brands(path: str = "config/brands.json") -> list[BrandConfig]:
             BrandConfig(
                 name=entry["name"],
                 category=entry["category"],
-                search_terms=entry["search_terms"],
+                search_terms=list(entry["search_terms"]),
                 ebay_search_suffix=entry.get("ebay_search_suffix", ""),
                 min_ebay_price=entry.get("min_ebay_price", 10),
             )
@@ -61,7 +81,12 @@ def load_settings(path: str = "config/settings.json") -> Settings:
     if not filepath.exists():
         return Settings()
 
-    with open(filepath) as f:
-        data = json.load(f)
+    data = _load_json(str(filepath), filepath.stat().st_mtime_ns)
 
-    return Settings(**{k: v for k, v in data.items() if hasattr(Settings, k)})
+    names = {f.name for f in fields(Settings)}
+    # Copy nested dicts so the cached parse is never mutated through Settings
+    return Settings(**{
+        k: dict(v) if isinstance(v, dict) else v
+        for k, v in data.items()
+        if k in names
+    })
@@ -1,63 +1,90 @@
 import re
 
+import ahocorasick
+
 from ..config import BrandConfig
 from ..models.estate_sale import EstateSale, SaleItem
+from .word_boundary import is_boundary
 
 
 class BrandMatcher:
-    """Match brand names against estate sale descriptions using regex."""
+    """Match brand names against estate sale descriptions using Aho-Corasick."""
+
+    _PRICE_RE = re.compile(r"\$(\d+(?:,\d{3})*(?:\.\d{2})?)")
 
     def __init__(self, brands: list[BrandConfig]):
         self.brands = brands
-        # Pre-compile regex patterns for each brand's search terms
-        self._patterns: dict[str, list[re.Pattern]] = {}
-        for brand in brands:
-            patterns = []
+        # One automaton over every brand's search terms, so each description
+        # is scanned in a single pass instead of once per term
+        # Brands may share a term, so each key maps to every brand using it
+        term_brands: dict[str, list[int]] = {}
+        for index, brand in enumerate(brands):
             for term in brand.search_terms:
-                pattern = re.compile(
-                    r"\b" + re.escape(term) + r"\b", re.IGNORECASE
-                )
-                patterns.append(pattern)
-            self._patterns[brand.name] = patterns
+                indices = term_brands.setdefault(term.lower(), [])
+                if index not in indices:
+                    indices.append(index)
+        self._automaton = ahocorasick.Automaton()
+        for key, indices in term_brands.items():
+            self._automaton.add_word(key, (tuple(indices), len(key)))
+        self._automaton.make_automaton()
+        # Descriptions shorter than every term can't match; 0 means no terms
+        self._min_term_len = min(
+            (len(term) for brand in brands for term in brand.search_terms),
+            default=0,
+        )
 
     def match_sale(self, sale: EstateSale) -> list[SaleItem]:
         """Find all brand matches in a sale's description."""
         text = sale.description
-        if not text:
+        if not text or not self._min_term_len or len(text) < self._min_term_len:
             return []
 
-        matched_items = []
+        text_l = text.lower()
+        # Lowercasing can change the length (e.g. "İ" becomes two code
+        # points); then map offsets in text_l back to positions in text
+        pos_map = None
+        if len(text_l) != len(text):
+            pos_map = [i for i, ch in enumerate(text) for _ in ch.lower()]
+        # brand index -> (start, end) of its first whole-word match
+        spans: dict[int, tuple[int, int]] = {}
 
-        for brand in self.brands:
-            for pattern in self._patterns[brand.name]:
-                match = pattern.search(text)
-                if match:
-                    # Extract context around the match
-                    start = max(0, match.start() - 100)
-                    end = min(len(text), match.end() + 100)
-                    context = text[start:end].strip()
+        for end_idx, (indices, length) in self._automaton.iter(text_l):
+            start = end_idx - length + 1
+            end = end_idx + 1
+            if not (is_boundary(text_l, start) and is_boundary(text_l, end)):
+                continue
+            if pos_map is not None:
+                start, end = pos_map[start], pos_map[end - 1] + 1
+            for index in indices:
+                spans.setdefault(index, (start, end))  # One match per brand per sale
+            if len(spans) == len(self.brands):
+                break
+
+        matched_items = []
+        for index in sorted(spans):
+            start, end = spans[index]
+            # Extract context around the match
+            context = text[max(0, start - 100):min(len(text), end + 100)].strip()
 
-                    item = SaleItem(
-                        brand=brand.name,
-                        description=context,
-                        estimated_price=self._extract_price_near_match(text, match),
-                        confidence=1.0,
-                        source="text",
-                    )
-                    matched_items.append(item)
-                    break  # One match per brand per sale
+            item = SaleItem(
+                brand=self.brands[index].name,
+                description=context,
+                estimated_price=self._extract_price_near_match(text, start, end),
+                confidence=1.0,
+                source="text",
+            )
+            matched_items.append(item)
 
         return matched_items
 
-    @staticmethod
-    def _extract_price_near_match(text: str, match: re.Match) -> float | None:
+    @classmethod
+    def _extract_price_near_match(cls, text: str, start: int, end: int) -> float | None:
         """Try to find a dollar amount near the brand mention."""
-        region_start = max(0, match.start() - 200)
-        region_end = min(len(text), match.end() + 200)
+        region_start = max(0, start - 200)
+        region_end = min(len(text), end + 200)
         region = text[region_start:region_end]
 
-        price_pattern = re.compile(r"\$(\d+(?:,\d{3})*(?:\.\d{2})?)")
-        price_match = price_pattern.search(region)
+        price_match = cls._PRICE_RE.search(region)
         if price_match:
             price_str = price_match.group(1).replace(",", "")
             try:
@@ -1,14 +1,13 @@
-import statistics
-
-from ..models.ebay_listing import EbaySoldListing
+import numpy as np
 
 
 class PriceAnalyzer:
-    """Compute price statistics from eBay sold listings."""
+    """Compute price statistics from eBay sold prices."""
 
     @staticmethod
-    def analyze(listings: list[EbaySoldListing]) -> dict:
-        if not listings:
+    def analyze(prices: np.ndarray) -> dict:
+        prices = np.asarray(prices, dtype=np.float64)
+        if not prices.size:
             return {
                 "count": 0,
                 "median": 0.0,
@@ -17,22 +16,20 @@ class PriceAnalyzer:
                 "max": 0.0,
             }
 
-        prices = [listing.sold_price for listing in listings]
-
         # Remove outliers beyond 2 standard deviations (if enough data)
-        if len(prices) >= 5:
-            mean = statistics.mean(prices)
-            stdev = statistics.stdev(prices)
+        if prices.size >= 5:
+            mean = prices.mean()
+            stdev = prices.std(ddof=1)
             if stdev > 0:
-                prices = [p for p in prices if abs(p - mean) <= 2 * stdev]
+                mask = np.abs(prices - mean) <= 2 * stdev
                 # Ensure we still have data after filtering
-                if not prices:
-                    prices = [listing.sold_price for listing in listings]
+                if mask.any():
+                    prices = prices[mask]
 
         return {
-            "count": len(prices),
-            "median": round(statistics.median(prices), 2),
-            "average": round(statistics.mean(prices), 2),
-            "min": round(min(prices), 2),
-            "max": round(max(prices), 2),
+            "count": int(prices.size),
+            "median": round(float(np.median(prices)), 2),
+            "average": round(float(prices.mean()), 2),
+            "min": round(float(prices.min()), 2),
+            "max": round(float(prices.max()), 2),
         }
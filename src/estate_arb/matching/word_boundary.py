@@ -0,0 +1,9 @@
+def is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def is_boundary(text: str, pos: int) -> bool:
+    """Mirror regex ``\\b``: a word char on exactly one side of ``pos``."""
+    before = pos > 0 and is_word_char(text[pos - 1])
+    after = pos < len(text) and is_word_char(text[pos])
+    return before != after
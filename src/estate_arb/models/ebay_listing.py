@@ -1,16 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import numpy as np
 
-@dataclass
-class EbaySoldListing:
-    """A single sold listing from eBay."""
-    title: str
-    sold_price: float
-    sold_date: str = ""
-    condition: str = ""
-    url: str = ""
-    shipping_cost: float = 0.0
 
-    @property
-    def total_price(self) -> float:
-        return self.sold_price + self.shipping_cost
+@dataclass(slots=True)
+class SoldBatch:
+    """Sold prices for one eBay query.
+
+    ``prices`` is a contiguous float64 array so price stats can run on it
+    directly.
+    """
+    prices: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.float64)
+    )
+
+    def __len__(self) -> int:
+        return int(self.prices.size)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class SaleItem:
     """An item detected within an estate sale (from text or photo analysis)."""
     brand: str
@@ -15,7 +15,7 @@ class SaleItem:
     ebay_query: str = ""  # short eBay search query from vision model
 
 
-@dataclass
+@dataclass(slots=True)
 class EstateSale:
     """An estate sale listing from EstateSales.net."""
     sale_id: str
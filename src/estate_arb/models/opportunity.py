@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageOpportunity:
     """A potential arbitrage opportunity combining estate sale + eBay data."""
     estate_sale_title: str
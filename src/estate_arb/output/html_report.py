@@ -1,13 +1,17 @@
 import html
 import logging
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+import ahocorasick
+
+from ..matching.word_boundary import is_boundary
 from ..models.opportunity import ArbitrageOpportunity
 
 logger = logging.getLogger(__name__)
 
-# Keyword-based category classification — uses word-boundary regex to avoid
+# Keyword-based category classification — uses word-boundary checks to avoid
 # false positives like "pin" matching "camping" or "dress" matching "dresser".
 _CATEGORIES = {
     "Furniture": [
@@ -78,39 +82,56 @@ _CATEGORIES = {
     ],
 }
 
-# Pre-compile word-boundary regex for each keyword
-import re as _re
-_CAT_PATTERNS: dict[str, list[tuple[str, _re.Pattern]]] = {}
+# One Aho-Corasick automaton over every keyword, so each text is scanned in a
+# single pass instead of walking a ~200-way regex alternation
+_KW_TO_CAT: dict[str, str] = {}
 for _cat, _kws in _CATEGORIES.items():
-    _CAT_PATTERNS[_cat] = [
-        (kw, _re.compile(r"\b" + _re.escape(kw) + r"\b", _re.IGNORECASE))
-        for kw in _kws
-    ]
+    for _kw in _kws:
+        _KW_TO_CAT.setdefault(_kw.lower(), _cat)
+_CAT_AUTOMATON = ahocorasick.Automaton()
+for _kw, _cat in _KW_TO_CAT.items():
+    _CAT_AUTOMATON.add_word(_kw, (len(_kw), _cat))
+_CAT_AUTOMATON.make_automaton()
+_MAX_KW_LEN = max(map(len, _KW_TO_CAT))
+
+
+def _find_category(text: str) -> str | None:
+    """Category of the leftmost whole-word keyword, longest at that position."""
+    if not text:
+        return None
+    text = text.lower()
+    best: tuple[int, int, str] | None = None  # (start, -length, category)
+    for end_idx, (length, cat) in _CAT_AUTOMATON.iter(text):
+        start = end_idx - length + 1
+        # Matches arrive by end position; nothing later can start before best
+        if best is not None and end_idx - _MAX_KW_LEN + 1 > best[0]:
+            break
+        if is_boundary(text, start) and is_boundary(text, end_idx + 1):
+            candidate = (start, -length, cat)
+            if best is None or candidate < best:
+                best = candidate
+    return best[2] if best else None
+
+
+# {{NAME}} markers in _TEMPLATE
+import re as _re
+_PLACEHOLDER_RE = _re.compile(r"\{\{(\w+)\}\}")
 
 
 def _categorize(opp: ArbitrageOpportunity) -> str:
     """Assign a category based on brand/item_type first, then description."""
-    # Prioritize brand and item_type — these are the primary match, not noise
-    primary = " ".join([
-        opp.item_type or "",
-        opp.matched_brand or "",
-    ])
-
-    for category, patterns in _CAT_PATTERNS.items():
-        for _, pat in patterns:
-            if pat.search(primary):
-                return category
-
-    # Fall back to full description only if brand/item didn't match
-    fallback = " ".join([
-        opp.matched_description or "",
-        opp.vision_reasoning or "",
-    ])
-
-    for category, patterns in _CAT_PATTERNS.items():
-        for _, pat in patterns:
-            if pat.search(fallback):
-                return category
+    # Prioritize brand and item_type — these are the primary match, not noise.
+    # Fields are scanned one at a time so the long description and reasoning
+    # are only read when the short fields don't match.
+    for text in (
+        opp.item_type,
+        opp.matched_brand,
+        opp.matched_description,
+        opp.vision_reasoning,
+    ):
+        category = _find_category(text)
+        if category:
+            return category
 
     return "Other"
 
@@ -128,45 +149,62 @@ def generate_html_report(
     path = out / "index.html"
 
     now = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    rows = _build_rows(opportunities)
-
-    # Collect category counts for filter buttons
-    cat_counts: dict[str, int] = {}
-    for opp in opportunities:
-        cat = _categorize(opp)
-        cat_counts[cat] = cat_counts.get(cat, 0) + 1
-    # Sort by count descending
-    sorted_cats = sorted(cat_counts.items(), key=lambda x: x[1], reverse=True)
-    filter_buttons = ''.join(
-        f'<button class="filter-btn" data-cat="{cat}" onclick="filterCat(this)">'
-        f'{cat} <span class="count">{count}</span></button>'
-        for cat, count in sorted_cats
+    # Categorize each opportunity once; rows and filter counts share the result
+    categories = [_categorize(opp) for opp in opportunities]
+    # Sort indices on precomputed keys so comparisons are plain list lookups
+    keys = [opp.ebay_median_sold or 0 for opp in opportunities]
+    order = sorted(range(len(opportunities)), key=keys.__getitem__, reverse=True)
+
+    # Collect category counts for filter buttons, sorted by count descending
+    sorted_cats = Counter(categories).most_common()
+    filter_buttons = "".join(
+        [_FILTER_BTN_TMPL % (cat, cat, count) for cat, count in sorted_cats]
     )
 
-    content = _TEMPLATE.replace("{{GENERATED}}", now)
-    content = content.replace("{{TOTAL_SALES}}", str(total_sales))
-    content = content.replace("{{MATCHED_SALES}}", str(matched_sales))
-    content = content.replace("{{OPPORTUNITIES}}", str(len(opportunities)))
-    content = content.replace("{{VISION_FINDS}}", str(vision_finds))
-    content = content.replace("{{FILTER_BUTTONS}}", filter_buttons)
-    content = content.replace("{{ROWS}}", rows)
+    subs = {
+        "GENERATED": now,
+        "TOTAL_SALES": str(total_sales),
+        "MATCHED_SALES": str(matched_sales),
+        "OPPORTUNITIES": str(len(opportunities)),
+        "VISION_FINDS": str(vision_finds),
+        "FILTER_BUTTONS": filter_buttons,
+    }
+
+    def fill(m):
+        return subs[m.group(1)]
+
+    # Stream rows straight to disk between the template halves rather than
+    # building the whole document in memory
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(_PLACEHOLDER_RE.sub(fill, _TEMPLATE_HEAD))
+        for rank, idx in enumerate(order, 1):
+            if rank > 1:
+                f.write("\n")
+            f.write(_row_html(rank, opportunities[idx], categories[idx]))
+        f.write(_PLACEHOLDER_RE.sub(fill, _TEMPLATE_TAIL))
 
-    path.write_text(content, encoding="utf-8")
     logger.info(f"HTML report written to {path}")
     return str(path)
 
 
-def _esc(text: str) -> str:
-    return html.escape(str(text)) if text else ""
+def _esc(text: str | None) -> str:
+    """Escape text content; quotes only need escaping inside attributes."""
+    return html.escape(text, quote=False) if text else ""
+
+
+def _esc_attr(text: str | None) -> str:
+    return html.escape(text) if text else ""
+
+
+_SOURCE_BADGES = {
+    "vision": ("#d946ef", "AI Vision"),
+    "text": ("#06b6d4", "Text Match"),
+    "both": ("#22c55e", "Text + Vision"),
+}
 
 
 def _source_badge(source: str) -> str:
-    colors = {
-        "vision": ("#d946ef", "AI Vision"),
-        "text": ("#06b6d4", "Text Match"),
-        "both": ("#22c55e", "Text + Vision"),
-    }
-    color, label = colors.get(source, ("#94a3b8", source))
+    color, label = _SOURCE_BADGES.get(source, ("#94a3b8", source))
     return f'<span class="badge" style="background:{color}">{label}</span>'
 
 
@@ -186,65 +224,82 @@ _CAT_COLORS = {
 }
 
 
-def _build_rows(opportunities: list[ArbitrageOpportunity]) -> str:
-    sorted_opps = sorted(
-        opportunities, key=lambda o: o.ebay_median_sold or 0, reverse=True
-    )
-    parts = []
-    for i, opp in enumerate(sorted_opps, 1):
-        brand = _esc(opp.matched_brand)
-        item_type = _esc(opp.item_type) or _esc(opp.matched_description)
-        location = _esc(opp.estate_sale_location)
-        title = _esc(opp.estate_sale_title)
-        link = _esc(opp.estate_sale_url)
-        source = _source_badge(opp.detection_source)
-        reasoning = _esc(opp.vision_reasoning)
-        median = f"${opp.ebay_median_sold:,.2f}" if opp.ebay_median_sold else "N/A"
-        avg = f"${opp.ebay_average_sold:,.2f}" if opp.ebay_average_sold else "N/A"
-        low, high = opp.ebay_price_range or (0, 0)
-        price_range = f"${low:,.2f} - ${high:,.2f}" if high else "N/A"
-        samples = opp.ebay_sample_count or 0
-        estate_price = (
-            f"${opp.estate_price_estimate:,.2f}"
-            if opp.estate_price_estimate
-            else "Not listed"
-        )
-
-        category = _categorize(opp)
-        cat_color = _CAT_COLORS.get(category, "#475569")
-        cat_badge = f'<span class="badge cat-badge" style="background:{cat_color}">{category}</span>'
-
-        detail_parts = []
-        if title:
-            detail_parts.append(f"<strong>Sale:</strong> {title}")
-        if reasoning:
-            detail_parts.append(f"<strong>AI Insight:</strong> {reasoning}")
-        detail_parts.append(f"<strong>eBay Avg:</strong> {avg}")
-        detail_parts.append(f"<strong>eBay Range:</strong> {price_range}")
-        detail_parts.append(f"<strong>Samples:</strong> {samples} sold listings")
-        detail_parts.append(f"<strong>Estate Price:</strong> {estate_price}")
-        detail_html = "<br>".join(detail_parts)
-
-        parts.append(f"""
-        <tr class="main-row" data-cat="{_esc(category)}" onclick="toggleDetail(this)">
-            <td class="rank">{i}</td>
+# Row markup for one opportunity; filled positionally by _row_html
+_ROW_TMPL = """
+        <tr class="main-row" data-cat="%s" data-search="%s" onclick="toggleDetail(this)">
+            <td class="rank">%s</td>
             <td>
-                <div class="item-name">{brand}</div>
-                <div class="item-type">{item_type}</div>
-                {source} {cat_badge}
+                <div class="item-name">%s</div>
+                <div class="item-type">%s</div>
+                %s %s
             </td>
-            <td>{location}</td>
-            <td class="price">{median}</td>
-            <td class="samples">{samples}</td>
-            <td><a href="{link}" target="_blank" rel="noopener">View Sale</a></td>
+            <td>%s</td>
+            <td class="price">%s</td>
+            <td class="samples">%s</td>
+            <td><a href="%s" target="_blank" rel="noopener">View Sale</a></td>
         </tr>
-        <tr class="detail-row" data-cat="{_esc(category)}" style="display:none">
+        <tr class="detail-row" data-cat="%s" style="display:none">
             <td colspan="6">
-                <div class="detail">{detail_html}</div>
+                <div class="detail">%s</div>
             </td>
-        </tr>""")
+        </tr>"""
+
+_FILTER_BTN_TMPL = (
+    '<button class="filter-btn" data-cat="%s" onclick="filterCat(this)">'
+    '%s <span class="count">%s</span></button>'
+)
+
+
+def _row_html(rank: int, opp: ArbitrageOpportunity, category: str) -> str:
+    """Render the main and detail table rows for one opportunity."""
+    brand = _esc(opp.matched_brand)
+    item_type = _esc(opp.item_type) or _esc(opp.matched_description)
+    location = _esc(opp.estate_sale_location)
+    title = _esc(opp.estate_sale_title)
+    link = _esc_attr(opp.estate_sale_url)
+    source = _source_badge(opp.detection_source)
+    reasoning = _esc(opp.vision_reasoning)
+    median = f"${opp.ebay_median_sold:,.2f}" if opp.ebay_median_sold else "N/A"
+    avg = f"${opp.ebay_average_sold:,.2f}" if opp.ebay_average_sold else "N/A"
+    low, high = opp.ebay_price_range or (0, 0)
+    price_range = f"${low:,.2f} - ${high:,.2f}" if high else "N/A"
+    samples = opp.ebay_sample_count or 0
+    estate_price = (
+        f"${opp.estate_price_estimate:,.2f}"
+        if opp.estate_price_estimate
+        else "Not listed"
+    )
 
-    return "\n".join(parts)
+    cat_attr = _esc_attr(category)
+    # Lowercased text the client-side search box matches against: what the
+    # row shows, plus the estate price from its detail row
+    search = _esc_attr(" ".join([
+        opp.matched_brand or "",
+        opp.item_type or opp.matched_description or "",
+        _SOURCE_BADGES.get(opp.detection_source, ("", opp.detection_source or ""))[1],
+        opp.estate_sale_location or "",
+        category,
+        median,
+        estate_price,
+    ]).lower())
+    cat_color = _CAT_COLORS.get(category, "#475569")
+    cat_badge = f'<span class="badge cat-badge" style="background:{cat_color}">{category}</span>'
+
+    detail_parts = []
+    if title:
+        detail_parts.append(f"<strong>Sale:</strong> {title}")
+    if reasoning:
+        detail_parts.append(f"<strong>AI Insight:</strong> {reasoning}")
+    detail_parts.append(f"<strong>eBay Avg:</strong> {avg}")
+    detail_parts.append(f"<strong>eBay Range:</strong> {price_range}")
+    detail_parts.append(f"<strong>Samples:</strong> {samples} sold listings")
+    detail_parts.append(f"<strong>Estate Price:</strong> {estate_price}")
+    detail_html = "<br>".join(detail_parts)
+
+    return _ROW_TMPL % (
+        cat_attr, search, rank, brand, item_type, source, cat_badge,
+        location, median, samples, link, cat_attr, detail_html,
+    )
 
 
 _TEMPLATE = """<!DOCTYPE html>
@@ -370,22 +425,31 @@ function searchFilter(val){
   applyFilters();
 }
 
+// Rows bucketed by category once, so a filter change only touches the rows
+// that were showing plus the rows of the chosen category
+const rows=Array.from(document.querySelectorAll('.main-row'));
+const byCat={all:rows};
+rows.forEach(row=>(byCat[row.dataset.cat]=byCat[row.dataset.cat]||[]).push(row));
+let shown=rows;
+
 function applyFilters(){
-  const rows=document.querySelectorAll('.main-row');
-  let visible=0;
-  rows.forEach(row=>{
-    const detail=row.nextElementSibling;
-    const cat=row.dataset.cat;
-    const text=row.innerText.toLowerCase();
-    const catMatch=activeCat==='all'||cat===activeCat;
-    const searchMatch=!searchTerm||text.includes(searchTerm);
-    const show=catMatch&&searchMatch;
-    row.style.display=show?'':'none';
-    detail.style.display='none';
-    if(show)visible++;
+  shown.forEach(row=>{
+    row.style.display='none';
+    row.nextElementSibling.style.display='none';
   });
-  document.getElementById('no-results').style.display=visible?'none':'block';
+  const next=[];
+  (byCat[activeCat]||[]).forEach(row=>{
+    if(!searchTerm||row.dataset.search.includes(searchTerm)){
+      row.style.display='';
+      next.push(row);
+    }
+  });
+  shown=next;
+  document.getElementById('no-results').style.display=next.length?'none':'block';
 }
 </script>
 </body>
 </html>"""
+
+# Rows are streamed between these halves
+_TEMPLATE_HEAD, _TEMPLATE_TAIL = _TEMPLATE.split("{{ROWS}}")
@@ -13,11 +13,10 @@ class TerminalOutput:
         self.console = Console()
 
     def display_opportunities(self, opportunities: list[ArbitrageOpportunity]):
-        sorted_opps = sorted(
-            opportunities,
-            key=lambda o: o.ebay_median_sold,
-            reverse=True,
-        )
+        # Sort indices on precomputed keys so comparisons are plain list lookups
+        keys = [o.ebay_median_sold for o in opportunities]
+        order = sorted(range(len(opportunities)), key=keys.__getitem__, reverse=True)
+        sorted_opps = [opportunities[i] for i in order]
 
         self.console.print()
         self.console.print(
@@ -1,20 +1,33 @@
 import asyncio
 import logging
 import random
+import re
 
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 logger = logging.getLogger(__name__)
 
+# Third-party analytics/ad hosts that never carry data we scrape
+_TRACKER_RE = re.compile(
+    r"doubleclick\.net|google-analytics\.com|googletagmanager\.com|"
+    r"googlesyndication\.com|scorecardresearch\.com|facebook\.net|"
+    r"adsrvr\.org|criteo\.(?:com|net)|hotjar\.com"
+)
+
 
 class BaseScraper:
     """Base class providing Playwright browser management, rate limiting, and retry logic."""
 
+    # Resource types aborted for every page in the session. Stylesheets are
+    # left alone since innerText depends on computed visibility.
+    BLOCKED_RESOURCE_TYPES: frozenset[str] = frozenset()
+
     def __init__(
         self,
         delay: float = 2.0,
         headless: bool = True,
         user_agent: str | None = None,
+        context_pool_size: int = 2,
     ):
         self.delay = delay
         self.headless = headless
@@ -22,30 +35,79 @@ class BaseScraper:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
         )
+        self.context_pool_size = max(1, context_pool_size)
         self._browser: Browser | None = None
+        # Warm contexts kept for the whole session, with open-page counts
+        self._contexts: list[BrowserContext] = []
+        self._context_pages: list[int] = []
         self._playwright = None
+        # Loop time before which the next navigation may not start; shared by
+        # every task on this scraper so concurrency never raises the host rate
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
 
     async def __aenter__(self):
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        # A few contexts live for the whole session, so pages skip context
+        # setup and share cookies. Playwright disables the HTTP cache on
+        # routed contexts, so scrapers that block resources get no cache reuse.
+        for _ in range(self.context_pool_size):
+            context = await self._browser.new_context(
+                user_agent=self.user_agent,
+                viewport={"width": 1920, "height": 1080},
+            )
+            if self.BLOCKED_RESOURCE_TYPES:
+                await self._block_resources(context, self.BLOCKED_RESOURCE_TYPES)
+            self._contexts.append(context)
+            self._context_pages.append(0)
         return self
 
     async def __aexit__(self, *args):
+        for context in self._contexts:
+            await context.close()
         if self._browser:
             await self._browser.close()
         if self._playwright:
             await self._playwright.stop()
 
     async def _new_page(self) -> Page:
-        context = await self._browser.new_context(
-            user_agent=self.user_agent,
-            viewport={"width": 1920, "height": 1080},
-        )
-        return await context.new_page()
+        """Open a page in the pooled context with the fewest open pages.
+
+        Contexts are shared rather than checked out, so callers never wait
+        for one; the count drops again when the page closes.
+        """
+        index = min(range(len(self._contexts)), key=self._context_pages.__getitem__)
+        page = await self._contexts[index].new_page()
+        self._context_pages[index] += 1
+
+        def release(_page):
+            self._context_pages[index] -= 1
+
+        page.once("close", release)
+        return page
+
+    @staticmethod
+    async def _block_resources(target, resource_types: frozenset[str]):
+        """Abort requests of ``resource_types`` or to tracker hosts on a page or context."""
+
+        async def filter_request(route):
+            request = route.request
+            if request.resource_type in resource_types or _TRACKER_RE.search(request.url):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await target.route("**/*", filter_request)
 
     async def _rate_limit(self):
-        jitter = random.uniform(0.5, 1.5)
-        await asyncio.sleep(self.delay * jitter)
+        """Wait for this scraper's next request slot, spaced by a jittered delay."""
+        loop = asyncio.get_running_loop()
+        async with self._rate_lock:
+            now = loop.time()
+            slot = max(now, self._next_request_at)
+            self._next_request_at = slot + self.delay * random.uniform(0.5, 1.5)
+        await asyncio.sleep(slot - now)
 
     async def _safe_get(
         self,
@@ -56,6 +118,7 @@ class BaseScraper:
         timeout: int = 15000,
         max_retries: int = 3,
     ) -> bool:
+        backoff = 0.5
         for attempt in range(max_retries):
             try:
                 await page.goto(url, wait_until=wait_until, timeout=timeout)
@@ -67,5 +130,8 @@ class BaseScraper:
                 if attempt == max_retries - 1:
                     logger.error(f"Failed to load {url} after {max_retries} attempts")
                     return False
-                await asyncio.sleep(2 ** attempt)
+                # Decorrelated jitter: retries spread out instead of
+                # landing on eBay in lockstep, capped at 10s
+                backoff = min(10.0, random.uniform(0.5, backoff * 3))
+                await asyncio.sleep(backoff)
         return False
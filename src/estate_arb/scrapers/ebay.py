@@ -1,152 +1,167 @@
+import asyncio
 import logging
-import re
 from urllib.parse import quote_plus
 
+import numpy as np
+
 from .base import BaseScraper
-from ..models.ebay_listing import EbaySoldListing
+from ..models.ebay_listing import SoldBatch
 
 logger = logging.getLogger(__name__)
 
+# Extracts every listing card on a results page in a single evaluate call.
+# Price, title and sold-date cleanup happen here so Python only gets final
+# values; title and sold date only decide whether a card is kept.
+_EXTRACT_CARDS_JS = r"""() => {
+    const toNum = s => {
+        s = s.trim();
+        if (!s) return null;
+        const n = Number(s);
+        return Number.isNaN(n) ? null : n;
+    };
+
+    // Handles ranges ("$10.00 to $25.00") by averaging
+    const parsePrice = text => {
+        const cleaned = text.replace(/[$,]/g, '').trim();
+        if (cleaned.includes(' to ')) {
+            const parts = cleaned.split(' to ');
+            const low = toNum(parts[0]), high = toNum(parts[1]);
+            return (low === null || high === null) ? null : (low + high) / 2;
+        }
+        return toNum(cleaned);
+    };
+
+    const SOLD_RE = /^Sold\s+/;
+
+    const textOf = (el, selector) => {
+        const found = el.querySelector(selector);
+        return found ? found.innerText.trim() : '';
+    };
+
+    return Array.from(document.querySelectorAll('li.s-card')).map(el => {
+        const title_el = el.querySelector('.s-card__title');
+        const title = title_el
+            ? title_el.innerText.trim().replace(/\s*Opens in a new window or tab\s*$/, '')
+            : '';
+
+        // Price and sold date have dedicated elements on current cards
+        let price = textOf(el, '.s-card__price');
+        if (!price.startsWith('$') || price.includes('delivery')) price = '';
+        let sold_date = textOf(el, '.s-card__caption');
+        sold_date = sold_date.startsWith('Sold ') ? sold_date.replace(SOLD_RE, '') : '';
+
+        // If the targeted lookups missed, classify every span as before
+        if (!price || !sold_date) {
+            for (const s of el.querySelectorAll('span')) {
+                const t = s.innerText.trim();
+                if (!price && t.startsWith('$') && !t.includes('delivery'))
+                    price = t;
+                else if (!sold_date && t.startsWith('Sold '))
+                    sold_date = t.replace(SOLD_RE, '');
+            }
+        }
+
+        return {
+            title,
+            price: parsePrice(price),
+            sold_date,
+        };
+    });
+}"""
+
 
 class EbaySoldScraper(BaseScraper):
     """Scrapes eBay sold/completed listings for price data."""
 
     SEARCH_URL = "https://www.ebay.com/sch/i.html"
+    # Only the result markup matters; thumbnails and fonts are dead weight
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+    def __init__(self, *args, page_concurrency: int = 4, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Shared across queries so the total number of in-flight eBay pages
+        # stays bounded no matter how many searches run at once
+        self._page_sem = asyncio.Semaphore(page_concurrency)
 
-    async def search_sold(
-        self, query: str, max_pages: int = 3
-    ) -> list[EbaySoldListing]:
+    async def search_sold(self, query: str, max_pages: int = 3) -> SoldBatch:
         """Search eBay for sold listings matching the query."""
-        all_listings: list[EbaySoldListing] = []
-        page = await self._new_page()
-
-        try:
-            for page_num in range(1, max_pages + 1):
-                encoded_query = quote_plus(query)
-                url = (
-                    f"{self.SEARCH_URL}?_nkw={encoded_query}"
-                    f"&_sacat=0&rt=nc&LH_Sold=1&LH_Complete=1&_pgn={page_num}"
-                )
+        encoded_query = quote_plus(query)
+        urls = [
+            f"{self.SEARCH_URL}?_nkw={encoded_query}"
+            f"&_sacat=0&rt=nc&LH_Sold=1&LH_Complete=1&_pgn={page_num}"
+            for page_num in range(1, max_pages + 1)
+        ]
+        # Page 1 decides whether more pages exist; only a full first page
+        # fans out to the rest, so short result sets cost a single load
+        first = await self._fetch_page(query, 1, urls[0])
+        results = [first]
+        if first is not None and len(first) >= 10 and len(urls) > 1:
+            results += await asyncio.gather(
+                *(self._fetch_page(query, page_num, url)
+                  for page_num, url in enumerate(urls[1:], 2))
+            )
 
+        prices: list[float] = []
+        for listings in results:
+            if listings is None:
+                break
+            prices.extend(card["price"] for card in listings)
+            # Fewer results than expected means this was the last page
+            if len(listings) < 10:
+                break
+
+        return SoldBatch(prices=np.asarray(prices, dtype=np.float64))
+
+    async def _fetch_page(
+        self, query: str, page_num: int, url: str
+    ) -> list[dict] | None:
+        """Load one results page and return its sold cards. None if it failed to load."""
+        async with self._page_sem:
+            page = await self._new_page()
+            try:
                 await self._rate_limit()
-                success = await self._safe_get(page, url, wait_selector=".srp-results")
+                # Return at commit and poll for the results instead of waiting
+                # on domcontentloaded, which also waits for deferred scripts
+                success = await self._safe_get(
+                    page, url, wait_selector=".srp-results", wait_until="commit"
+                )
                 if not success:
                     logger.warning(f"Could not load eBay page {page_num} for '{query}'")
-                    break
-
-                # eBay uses li.s-card for listing cards
-                items = await page.query_selector_all("li.s-card")
-                page_count = 0
-                for item_el in items:
-                    listing = await self._parse_listing(item_el)
-                    if listing:
-                        all_listings.append(listing)
-                        page_count += 1
+                    return None
+                # The results list can appear before every card is parsed;
+                # readyState leaves "loading" once parsing is done
+                try:
+                    await page.wait_for_function(
+                        "document.readyState !== 'loading'", timeout=10000
+                    )
+                except Exception as e:
+                    logger.warning(f"eBay page {page_num} for '{query}' never finished parsing: {e}")
+                    return None
+
+                # Pull every card in one evaluate instead of a round trip per card
+                try:
+                    raw = await page.evaluate(_EXTRACT_CARDS_JS)
+                except Exception as e:
+                    logger.debug(f"Failed to extract listing cards: {e}")
+                    raw = []
+                listings = [data for data in raw if self._is_sold_card(data)]
 
                 logger.info(
-                    f"eBay page {page_num}: {page_count} listings for '{query}'"
+                    f"eBay page {page_num}: {len(listings)} listings for '{query}'"
                 )
-
-                # Stop if we got fewer results than expected (last page)
-                if page_count < 10:
-                    break
-        finally:
-            await page.close()
-
-        return all_listings
-
-    async def _parse_listing(self, element) -> EbaySoldListing | None:
-        """Parse a single sold listing element (li.s-card) from eBay search results."""
-        try:
-            # Extract all data from the card via a single JS evaluation
-            data = await element.evaluate("""el => {
-                const title_el = el.querySelector('.s-card__title');
-                const title = title_el ? title_el.innerText.trim() : '';
-
-                // Find all spans and extract relevant text
-                const spans = el.querySelectorAll('span');
-                let price = '', sold_date = '', condition = '', shipping = '';
-                for (const s of spans) {
-                    const t = s.innerText.trim();
-                    if (!price && t.startsWith('$') && !t.includes('delivery'))
-                        price = t;
-                    else if (!sold_date && t.startsWith('Sold '))
-                        sold_date = t;
-                    else if (!condition && (t === 'Pre-Owned' || t === 'Brand New' || t === 'New' || t === 'Refurbished' || t.startsWith('Open box') || t === 'For parts or not working'))
-                        condition = t;
-                    else if (!shipping && (t.includes('delivery') || t.includes('shipping')))
-                        shipping = t;
-                }
-
-                const link_el = el.querySelector('a.s-card__link');
-                const url = link_el ? link_el.href : '';
-
-                return {title, price, sold_date, condition, shipping, url};
-            }""")
-
-            title = data.get("title", "")
-            # Clean up "Opens in a new window or tab" suffix
-            title = re.sub(r"\s*Opens in a new window or tab\s*$", "", title)
-
-            # Skip placeholder items
-            if not title or title.lower().startswith("shop on ebay"):
-                return None
-
-            price = self._parse_price(data.get("price", ""))
-            if price is None:
-                return None
-
-            sold_date = data.get("sold_date", "")
-            # Only include items that were actually sold
-            if not sold_date:
-                return None
-            sold_date = re.sub(r"^Sold\s+", "", sold_date)
-
-            shipping = self._parse_shipping(data.get("shipping", ""))
-
-            return EbaySoldListing(
-                title=title,
-                sold_price=price,
-                sold_date=sold_date,
-                condition=data.get("condition", ""),
-                url=data.get("url", ""),
-                shipping_cost=shipping,
-            )
-        except Exception as e:
-            logger.debug(f"Failed to parse listing element: {e}")
-            return None
-
-    @staticmethod
-    def _parse_price(price_text: str) -> float | None:
-        """Parse eBay price text into a float. Handles ranges by averaging."""
-        cleaned = price_text.replace("$", "").replace(",", "").strip()
-
-        # Handle range: "$10.00 to $25.00"
-        if " to " in cleaned:
-            parts = cleaned.split(" to ")
-            try:
-                low = float(parts[0].strip())
-                high = float(parts[1].strip())
-                return (low + high) / 2
-            except (ValueError, IndexError):
-                return None
-
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
-
-    @staticmethod
-    def _parse_shipping(ship_text: str) -> float:
-        """Parse shipping cost text. Returns 0.0 for free shipping."""
-        lower = ship_text.lower()
-        if "free" in lower:
-            return 0.0
-
-        match = re.search(r"\$(\d+(?:\.\d{2})?)", ship_text)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:
-                pass
-        return 0.0
+                return listings
+            finally:
+                await page.close()
+
+    def _is_sold_card(self, data: dict) -> bool:
+        """Whether one extracted card (li.s-card) is a real sold listing with a price."""
+        title = data.get("title", "")
+        # Skip placeholder items
+        if not title or title.lower().startswith("shop on ebay"):
+            return False
+
+        if data.get("price") is None:
+            return False
+
+        # Only include items that were actually sold
+        return bool(data.get("sold_date"))
@@ -1,9 +1,13 @@
 import asyncio
-import json
 import logging
 import re
+from collections import Counter
+from collections.abc import Callable
 from urllib.parse import urljoin
 
+import orjson
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
 from .base import BaseScraper
 from ..models.estate_sale import EstateSale
 
@@ -15,6 +19,57 @@ _ONLINE_PATTERNS = re.compile(
     re.IGNORECASE,
 )
 
+# Any run of HTML tags and whitespace collapses to one space, in one pass
+_TAG_WS_RE = re.compile(r"(?:<[^>]+>|\s)+")
+
+
+# Resource types skipped while loading the sales listing page. Stylesheets
+# stay: layout drives the lazy-load scrolling and the DOM fallback's innerText.
+_LISTING_BLOCKED_TYPES = frozenset({"image", "font", "media"})
+
+# Resource types the Angular app uses for its API calls
+_API_RESOURCE_TYPES = frozenset({"xhr", "fetch"})
+
+# API payloads name the same field differently across endpoints; the first
+# key present with a non-null value wins
+_FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    "sale_id": ("saleId", "id", "sale_id"),
+    "title": ("title", "name"),
+    "organizer": ("orgName", "companyName", "organizer"),
+    "address": ("address", "street"),
+    "city": ("city", "cityName"),
+    "state": ("state", "stateCode", "stateAbbreviation"),
+    "zip_code": ("zipCode", "postalCodeNumber", "zip"),
+    "url": ("url", "saleUrl"),
+    "description": ("description", "details"),
+    "photo_count": ("pictureCount", "photoCount"),
+    "distance": ("distance", "distanceMiles"),
+    "picture_url": ("url", "imageUrl"),
+}
+
+
+def _first(data: dict, field: str, default=""):
+    """Value of the first alias of ``field`` present in ``data``."""
+    for key in _FIELD_ALIASES[field]:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+def _is_api_response(response) -> bool:
+    """True for a successful XHR/fetch call to the site's JSON API."""
+    return (
+        response.request.resource_type in _API_RESOURCE_TYPES
+        and "/api/" in response.url
+        and response.status == 200
+    )
+
+
+def _clean_html(text: str) -> str:
+    """Strip tags from a description and normalize its whitespace."""
+    return _TAG_WS_RE.sub(" ", text).strip()
+
 
 class EstateSalesScraper(BaseScraper):
     """Scrapes EstateSales.net for upcoming estate sales near a location.
@@ -42,17 +97,24 @@ class EstateSalesScraper(BaseScraper):
             max_sales: Maximum number of sales to return
         """
         page = await self._new_page()
+        # The listing comes from API JSON (or page text), so thumbnails, fonts
+        # and media are never read here. Detail pages keep them for the DOM
+        # photo fallback.
+        await self._block_resources(page, _LISTING_BLOCKED_TYPES)
         sales: list[EstateSale] = []
         api_data: list[dict] = []
 
         # Intercept XHR responses to capture the sale data as JSON
         async def handle_response(response):
+            # Only XHR/fetch calls can carry API data; skip images, scripts, etc.
+            if response.request.resource_type not in _API_RESOURCE_TYPES:
+                return
             try:
                 url = response.url
                 if "/api/" in url and response.status == 200:
                     ct = response.headers.get("content-type", "")
                     if "json" in ct:
-                        body = await response.json()
+                        body = orjson.loads(await response.body())
                         if isinstance(body, list) and body:
                             # Check if this looks like sale data
                             first = body[0] if body else {}
@@ -60,13 +122,13 @@ class EstateSalesScraper(BaseScraper):
                                 k in first
                                 for k in ("saleId", "id", "title", "name", "address")
                             ):
-                                # Log sale type distribution
-                                if len(body) > 10:
-                                    type_counts: dict[str, int] = {}
-                                    for d in body:
-                                        tn = d.get("typeName", "unknown")
-                                        type_counts[tn] = type_counts.get(tn, 0) + 1
-                                    logger.debug(f"Sale types: {type_counts}")
+                                # Log sale type distribution (only tallied when
+                                # debug logging is actually on)
+                                if len(body) > 10 and logger.isEnabledFor(logging.DEBUG):
+                                    type_counts = Counter(
+                                        d.get("typeName", "unknown") for d in body
+                                    )
+                                    logger.debug(f"Sale types: {dict(type_counts)}")
                                 api_data.extend(body)
                                 logger.info(
                                     f"Intercepted API response with {len(body)} items"
@@ -89,14 +151,18 @@ class EstateSalesScraper(BaseScraper):
 
         try:
             logger.info(f"Loading estate sales page: {url}")
-            success = await self._safe_get(page, url)
+            # Instead of a fixed render delay, continue once the app's first
+            # API call has answered; handle_response still collects the data
+            success = False
+            try:
+                async with page.expect_response(_is_api_response, timeout=10000):
+                    success = await self._safe_get(page, url)
+            except PlaywrightTimeoutError:
+                logger.debug("No API response seen while loading the sales page")
             if not success:
                 logger.error(f"Failed to load {url}")
                 return []
 
-            # Wait for content to render
-            await asyncio.sleep(3)
-
             # Scroll down to trigger lazy loading of more sales
             for _ in range(3):
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
@@ -138,24 +204,19 @@ class EstateSalesScraper(BaseScraper):
     def _parse_api_sale(self, data: dict) -> EstateSale | None:
         """Parse a sale from intercepted API JSON data."""
         try:
-            sale_id = str(
-                data.get("saleId", data.get("id", data.get("sale_id", "")))
-            )
+            sale_id = str(_first(data, "sale_id"))
             if not sale_id:
                 return None
 
-            title = data.get("title", data.get("name", ""))
-            organizer = data.get(
-                "orgName",
-                data.get("companyName", data.get("organizer", "")),
-            )
-            address = data.get("address", data.get("street", ""))
-            city = data.get("city", data.get("cityName", ""))
-            state = data.get("state", data.get("stateCode", data.get("stateAbbreviation", "")))
-            zip_code = str(data.get("zipCode", data.get("postalCodeNumber", data.get("zip", ""))))
+            title = _first(data, "title")
+            organizer = _first(data, "organizer")
+            address = _first(data, "address")
+            city = _first(data, "city")
+            state = _first(data, "state")
+            zip_code = str(_first(data, "zip_code"))
 
             # Build URL — the Angular app needs /{STATE}/{City}/{ZIP}/{id} format
-            url_path = data.get("url", data.get("saleUrl", ""))
+            url_path = _first(data, "url")
             if url_path and not url_path.startswith("http"):
                 url = f"{self.BASE_URL}{url_path}"
             elif url_path:
@@ -177,26 +238,25 @@ class EstateSalesScraper(BaseScraper):
                 dates.append(str(data["dateRange"]))
 
             # Description
-            description = data.get("description", data.get("details", ""))
+            description = _first(data, "description")
             # Strip HTML tags if present
             if description:
-                description = re.sub(r"<[^>]+>", " ", description)
-                description = re.sub(r"\s+", " ", description).strip()
+                description = _clean_html(description)
 
             # Photos
             photo_urls = []
-            photo_count = data.get("pictureCount", data.get("photoCount", 0))
+            photo_count = _first(data, "photo_count", 0)
             if "pictures" in data and isinstance(data["pictures"], list):
                 for pic in data["pictures"]:
                     if isinstance(pic, str):
                         photo_urls.append(pic)
                     elif isinstance(pic, dict):
-                        pic_url = pic.get("url", pic.get("imageUrl", ""))
+                        pic_url = _first(pic, "picture_url")
                         if pic_url:
                             photo_urls.append(pic_url)
 
             # Distance
-            distance = data.get("distance", data.get("distanceMiles", None))
+            distance = _first(data, "distance", None)
             if distance is not None:
                 try:
                     distance = float(distance)
@@ -262,11 +322,11 @@ class EstateSalesScraper(BaseScraper):
             logger.info("No sale elements found, extracting sale links from page")
             links = await page.evaluate(
                 """() => {
+                const LINK_RE = /\\/[A-Z]{2}\\/[^/]+\\/\\d{5}\\/\\d+/;
                 const links = [];
                 document.querySelectorAll('a[href]').forEach(a => {
                     const href = a.href;
-                    if (href.match(/\\/[A-Z]{2}\\/[^/]+\\/\\d{5}\\/\\d+/) ||
-                        href.includes('/estate-sales/')) {
+                    if (LINK_RE.test(href) || href.includes('/estate-sales/')) {
                         links.push({
                             href: href,
                             text: a.innerText.trim().substring(0, 500)
@@ -319,6 +379,28 @@ class EstateSalesScraper(BaseScraper):
 
         return sales
 
+    async def enrich_sales(
+        self,
+        sales: list[EstateSale],
+        concurrency: int = 5,
+        on_enriched: Callable[[EstateSale], None] | None = None,
+    ) -> list[EstateSale]:
+        """Enrich several sales concurrently, at most ``concurrency`` at a time.
+
+        ``on_enriched`` is called as each sale finishes, e.g. to advance a
+        progress bar. Returns the sales in input order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run(sale: EstateSale) -> EstateSale:
+            async with sem:
+                result = await self.enrich_sale(sale)
+            if on_enriched:
+                on_enriched(result)
+            return result
+
+        return await asyncio.gather(*[run(s) for s in sales])
+
     async def enrich_sale(self, sale: EstateSale) -> EstateSale:
         """Visit a sale's detail page to extract full description and photos."""
         if not sale.url:
@@ -326,15 +408,19 @@ class EstateSalesScraper(BaseScraper):
 
         page = await self._new_page()
         api_detail: dict = {}
+        api_ready = asyncio.Event()
 
         # Intercept API responses for sale detail
         async def handle_response(response):
+            # Only XHR/fetch calls can carry API data; skip images, scripts, etc.
+            if response.request.resource_type not in _API_RESOURCE_TYPES:
+                return
             try:
                 url = response.url
                 if "/api/" in url and response.status == 200:
                     ct = response.headers.get("content-type", "")
                     if "json" in ct:
-                        body = await response.json()
+                        body = orjson.loads(await response.body())
                         if isinstance(body, dict):
                             # API wraps sale data in {"sale": {...}}
                             inner = body.get("sale", body)
@@ -349,6 +435,7 @@ class EstateSalesScraper(BaseScraper):
                                 )
                             ):
                                 api_detail.update(inner)
+                                api_ready.set()
             except Exception:
                 pass
 
@@ -361,11 +448,9 @@ class EstateSalesScraper(BaseScraper):
                 return sale
 
             # Wait for API responses to arrive (Angular app makes XHR calls after DOM load)
-            for _ in range(10):
-                if api_detail:
-                    break
-                await asyncio.sleep(0.5)
-            else:
+            try:
+                await asyncio.wait_for(api_ready.wait(), timeout=5)
+            except asyncio.TimeoutError:
                 # Give DOM fallback a moment to settle
                 await asyncio.sleep(1)
 
@@ -379,15 +464,14 @@ class EstateSalesScraper(BaseScraper):
                     or ""
                 )
                 if desc:
-                    desc = re.sub(r"<[^>]+>", " ", desc)
-                    sale.description = re.sub(r"\s+", " ", desc).strip()
+                    sale.description = _clean_html(desc)
 
                 if "pictures" in api_detail:
                     for pic in api_detail["pictures"]:
                         if isinstance(pic, str):
                             sale.photo_urls.append(pic)
                         elif isinstance(pic, dict):
-                            url = pic.get("url", pic.get("imageUrl", ""))
+                            url = _first(pic, "picture_url")
                             if url:
                                 sale.photo_urls.append(url)
                     sale.photo_count = len(sale.photo_urls)
@@ -1,14 +1,80 @@
 import asyncio
-import base64
-import json
 import logging
+import os
+import random
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from itertools import chain
+from typing import Any
 
 import aiohttp
 import boto3
+import orjson
+from botocore.config import Config
+from PIL import Image, ImageOps
+
+from ..models.estate_sale import EstateSale
 
 logger = logging.getLogger(__name__)
 
+# A ```-fenced reply: optional language tag line, body, optional closing fence
+_FENCE_RE = re.compile(r"\A```(?:[^\n]*\n)?(.*?)(?:```)?\s*\Z", re.DOTALL)
+
+# Photo download retries, for throttling and transient CDN failures
+_DOWNLOAD_RETRIES = 3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Long-edge limit Claude resizes to anyway; larger photos only cost bytes
+MAX_IMAGE_EDGE = 1568
+
+
+def _is_oversized(data: bytes) -> bool:
+    """True if the photo's long edge exceeds MAX_IMAGE_EDGE (reads the header only)."""
+    try:
+        with Image.open(BytesIO(data)) as img:
+            return max(img.size) > MAX_IMAGE_EDGE
+    except Exception:
+        return False
+
+
+def _downscale(data: bytes, media_type: str) -> tuple[bytes, str]:
+    """Shrink an oversized photo to MAX_IMAGE_EDGE and re-encode it as JPEG.
+
+    Photos already within the limit, or that Pillow can't decode, are
+    returned unchanged.
+    """
+    try:
+        with Image.open(BytesIO(data)) as img:
+            if max(img.size) <= MAX_IMAGE_EDGE:
+                return data, media_type
+            # Re-encoding drops EXIF, so bake the orientation in first
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE), Image.LANCZOS)
+            out = BytesIO()
+            img.convert("RGB").save(out, "JPEG", quality=85, optimize=True)
+            return out.getvalue(), "image/jpeg"
+    except Exception as e:
+        logger.debug(f"Could not downscale photo, sending original: {e}")
+        return data, media_type
+
+
+# Pillow releases the GIL while decoding and resizing, so threads give real
+# parallelism without pickling image bytes to and from worker processes
+_resize_pool: ThreadPoolExecutor | None = None
+
+
+def _get_resize_pool() -> ThreadPoolExecutor:
+    """Thread pool for photo decoding/resizing, created on first use."""
+    global _resize_pool
+    if _resize_pool is None:
+        _resize_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="resize"
+        )
+    return _resize_pool
+
+
 VISION_PROMPT = """You are an expert vintage clothing and collectibles appraiser working for an eBay reseller.
 Analyze these estate sale photos carefully. Your job is to identify items that have significant resale value on eBay.
 
@@ -51,20 +117,61 @@ If you see NO items of resale value, return an empty JSON array: []
 
 Respond ONLY with valid JSON. No markdown, no explanation outside the JSON."""
 
+# Appended to VISION_PROMPT when one request carries photos from several sales
+BATCH_PROMPT_SUFFIX = """
+
+These photos come from {count} different estate sales. Each sale's photos follow a "Sale N:" label.
+Instead of a single array, respond with a JSON object whose keys are the sale numbers as strings ("1", "2", ...) and whose values are that sale's array of items in the format above.
+Include every sale number, using [] for a sale with nothing of resale value."""
+
 
 class PhotoAnalyzer:
     """Analyze estate sale photos using Claude Sonnet via AWS Bedrock."""
 
+    # boto3 clients are thread-safe; one per (region, pool size) is plenty
+    _CLIENT_CACHE: dict[tuple[str, int], Any] = {}
+
     def __init__(
         self,
         region: str = "us-east-1",
         model_id: str = "us.anthropic.claude-sonnet-4-20250514-v1:0",
         max_photos_per_batch: int = 10,
+        http_session: aiohttp.ClientSession | None = None,
+        max_concurrent_requests: int = 4,
+        max_concurrent_downloads: int = 8,
     ):
         self.region = region
         self.model_id = model_id
         self.max_photos_per_batch = max_photos_per_batch
-        self._client = boto3.client("bedrock-runtime", region_name=region)
+        # Shared session from the caller so photo downloads reuse pooled connections
+        self.http_session = http_session
+        # Fallback session owned by the analyzer, created on first download
+        self._session: aiohttp.ClientSession | None = None
+        # Caps simultaneous photo downloads so the CDN doesn't start throttling
+        self._dl_sem = asyncio.Semaphore(max_concurrent_downloads)
+        # Bounds in-flight Bedrock requests across every caller of this analyzer
+        self._sem = asyncio.Semaphore(max_concurrent_requests)
+        # boto3 is synchronous, so calls run on a dedicated pool sized to the
+        # request limit, with a matching connection pool, rather than competing
+        # for the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_requests, thread_name_prefix="bedrock"
+        )
+        self._client = self._get_client(region, max_concurrent_requests)
+
+    @classmethod
+    def _get_client(cls, region: str, max_pool_connections: int):
+        """Shared bedrock-runtime client, so analyzers reuse its endpoint and TLS pool."""
+        key = (region, max_pool_connections)
+        client = cls._CLIENT_CACHE.get(key)
+        if client is None:
+            client = boto3.client(
+                "bedrock-runtime",
+                region_name=region,
+                config=Config(max_pool_connections=max_pool_connections),
+            )
+            cls._CLIENT_CACHE[key] = client
+        return client
 
     async def analyze_sale_photos(
         self, photo_urls: list[str], max_photos: int = 30
@@ -85,32 +192,122 @@ class PhotoAnalyzer:
             return []
 
         logger.info(f"Downloaded {len(images)} photos, analyzing with Claude Vision...")
+        return await self._analyze_images(images)
+
+    async def _analyze_images(self, images: list[tuple[bytes, str]]) -> list[dict]:
+        """Analyze one sale's photos, split into as many requests as needed."""
+        # Process in batches to stay within token limits; batches are
+        # independent requests, so send them concurrently
+        step = self.max_photos_per_batch
+        batch_results = await asyncio.gather(
+            *[
+                self._analyze_batch(images[i : i + step])
+                for i in range(0, len(images), step)
+            ]
+        )
+        return self._dedupe(chain.from_iterable(batch_results))
 
-        # Process in batches to stay within token limits
-        all_items = []
-        for i in range(0, len(images), self.max_photos_per_batch):
-            batch = images[i : i + self.max_photos_per_batch]
-            batch_items = await self._analyze_batch(batch)
-            all_items.extend(batch_items)
+    async def analyze_sales_batch(
+        self,
+        sales: list[EstateSale],
+        max_photos_per_sale: int = 10,
+        max_sales_per_batch: int = 4,
+    ) -> list[list[dict]]:
+        """Analyze several sales' photos, sharing one prompt per Bedrock request.
+
+        Sales are packed into requests of at most ``max_sales_per_batch`` sales
+        and ``max_photos_per_batch`` photos; a sale's photos are never split
+        across shared requests. A sale with more photos than one request holds
+        is analyzed on its own, split over several requests like
+        ``analyze_sale_photos``. Returns one item list per sale, in input order.
+        """
+        downloads = await asyncio.gather(
+            *[self._download_photos(s.photo_urls[:max_photos_per_sale]) for s in sales]
+        )
+
+        results: list[list[dict]] = [[] for _ in sales]
+        groups: list[list[int]] = []
+        oversized: list[int] = []
+        group_photos = 0
+        for index, images in enumerate(downloads):
+            if not images:
+                continue
+            if len(images) > self.max_photos_per_batch:
+                oversized.append(index)
+                continue
+            if (
+                not groups
+                or len(groups[-1]) >= max_sales_per_batch
+                or group_photos + len(images) > self.max_photos_per_batch
+            ):
+                groups.append([])
+                group_photos = 0
+            groups[-1].append(index)
+            group_photos += len(images)
+
+        logger.info(
+            f"Analyzing {len(groups)} shared vision requests and "
+            f"{len(oversized)} large sales for {len(sales)} sales..."
+        )
+        group_results, oversized_results = await asyncio.gather(
+            asyncio.gather(
+                *[
+                    self._analyze_sales_group([downloads[i] for i in group])
+                    for group in groups
+                ]
+            ),
+            asyncio.gather(*[self._analyze_images(downloads[i]) for i in oversized]),
+        )
+        for group, group_items in zip(groups, group_results):
+            for index, items in zip(group, group_items):
+                results[index] = self._dedupe(items)
+        for index, items in zip(oversized, oversized_results):
+            results[index] = items
+
+        return results
 
-        # Deduplicate by brand + item_type
-        seen = set()
-        unique_items = []
-        for item in all_items:
-            key = (item.get("brand", ""), item.get("item_type", ""))
-            if key not in seen:
-                seen.add(key)
-                unique_items.append(item)
+    async def _analyze_sales_group(
+        self, sale_images: list[list[tuple[bytes, str]]]
+    ) -> list[list[dict]]:
+        """Send photos from several sales in one request; split the reply per sale."""
+        if len(sale_images) == 1:
+            return [await self._analyze_batch(sale_images[0])]
 
-        return unique_items
+        content = []
+        for number, images in enumerate(sale_images, 1):
+            content.append({"text": f"Sale {number}:"})
+            content.extend(self._image_blocks(images))
+        content.append(
+            {"text": VISION_PROMPT + BATCH_PROMPT_SUFFIX.format(count=len(sale_images))}
+        )
+
+        parsed = await self._invoke(content)
+        if not isinstance(parsed, dict):
+            if parsed is not None:
+                logger.warning(f"Unexpected batched vision response format: {type(parsed)}")
+            return [[] for _ in sale_images]
+
+        per_sale = []
+        for number in range(1, len(sale_images) + 1):
+            items = parsed.get(str(number), [])
+            per_sale.append(items if isinstance(items, list) else [])
+        return per_sale
+
+    @staticmethod
+    def _dedupe(items: Iterable[dict]) -> list[dict]:
+        """Deduplicate by brand + item_type, keeping the first occurrence."""
+        unique: dict[tuple, dict] = {}
+        for item in items:
+            unique.setdefault((item.get("brand", ""), item.get("item_type", "")), item)
+        return list(unique.values())
 
     async def _download_photos(
         self, urls: list[str]
     ) -> list[tuple[bytes, str]]:
         """Download photos concurrently. Returns list of (image_bytes, media_type)."""
-        async with aiohttp.ClientSession() as session:
-            tasks = [self._download_one(session, url) for url in urls]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        session = await self._get_session()
+        tasks = [self._download_one(session, url) for url in urls]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         images = []
         for result in results:
@@ -120,17 +317,55 @@ class PhotoAnalyzer:
                 logger.debug(f"Photo download failed: {result}")
         return images
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """The caller's shared session, or one persistent session of our own."""
+        if self.http_session:
+            return self.http_session
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=20, keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self._session
+
+    async def close(self):
+        """Release the Bedrock worker threads and the analyzer's own HTTP session.
+
+        A shared session is left to its owner.
+        """
+        self._executor.shutdown(wait=False)
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def _download_one(
         self, session: aiohttp.ClientSession, url: str
     ) -> tuple[bytes, str]:
         """Download a single photo and return (bytes, media_type)."""
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-            resp.raise_for_status()
-            content_type = resp.content_type or "image/jpeg"
-            # Map to Bedrock-supported media types
-            media_type = self._normalize_media_type(content_type)
-            data = await resp.read()
-            return (data, media_type)
+        for attempt in range(_DOWNLOAD_RETRIES):
+            try:
+                async with self._dl_sem, session.get(url) as resp:
+                    resp.raise_for_status()
+                    content_type = resp.content_type or "image/jpeg"
+                    data = await resp.read()
+                break
+            except aiohttp.ClientResponseError as e:
+                # Throttling and transient CDN errors are worth another try
+                if e.status not in _RETRY_STATUSES or attempt == _DOWNLOAD_RETRIES - 1:
+                    raise
+                await asyncio.sleep(0.5 * 2 ** attempt + random.random() * 0.1)
+
+        # Map to Bedrock-supported media types
+        media_type = self._normalize_media_type(content_type)
+        # Most photos are already small enough; only hand the CPU-bound
+        # decode/resize of oversized ones to the pool
+        if _is_oversized(data):
+            data, media_type = await asyncio.get_running_loop().run_in_executor(
+                _get_resize_pool(), _downscale, data, media_type
+            )
+        return (data, media_type)
 
     @staticmethod
     def _normalize_media_type(content_type: str) -> str:
@@ -144,84 +379,74 @@ class PhotoAnalyzer:
             return "image/webp"
         return "image/jpeg"
 
+    @staticmethod
+    def _image_blocks(images: list[tuple[bytes, str]]) -> list[dict]:
+        """Build Converse image content blocks from (bytes, media_type) pairs."""
+        # Converse takes raw bytes and a bare format name ("jpeg", "png", ...)
+        return [
+            {"image": {"format": media_type.split("/", 1)[1], "source": {"bytes": data}}}
+            for data, media_type in images
+        ]
+
     async def _analyze_batch(
         self, images: list[tuple[bytes, str]]
     ) -> list[dict]:
         """Send a batch of images to Claude via Bedrock and parse results."""
         # Build the content array with images + text prompt
-        content = []
-        for img_bytes, media_type in images:
-            b64_data = base64.b64encode(img_bytes).decode("utf-8")
-            content.append(
-                {
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": media_type,
-                        "data": b64_data,
-                    },
-                }
-            )
+        content = self._image_blocks(images)
+        content.append({"text": VISION_PROMPT})
 
-        content.append({"type": "text", "text": VISION_PROMPT})
-
-        request_body = json.dumps(
-            {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 4096,
-                "messages": [{"role": "user", "content": content}],
-                "temperature": 0.2,
-            }
-        )
+        items = await self._invoke(content)
+        if isinstance(items, list):
+            return items
+        if items is not None:
+            logger.warning(f"Unexpected vision response format: {type(items)}")
+        return []
 
+    async def _invoke(self, content: list[dict]):
+        """Call Claude via the Bedrock Converse API; return parsed JSON or None."""
+        text = ""
         try:
             # Run the synchronous boto3 call in a thread to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self._client.invoke_model(
-                    modelId=self.model_id,
-                    body=request_body,
-                    contentType="application/json",
-                    accept="application/json",
-                ),
-            )
-
-            response_body = json.loads(response["body"].read())
-            stop_reason = response_body.get("stop_reason", "unknown")
-            content_blocks = response_body.get("content", [])
+            loop = asyncio.get_running_loop()
+            async with self._sem:
+                response = await loop.run_in_executor(
+                    self._executor,
+                    lambda: self._client.converse(
+                        modelId=self.model_id,
+                        messages=[{"role": "user", "content": content}],
+                        inferenceConfig={"maxTokens": 4096, "temperature": 0.2},
+                    ),
+                )
+
+            stop_reason = response.get("stopReason", "unknown")
+            content_blocks = response.get("output", {}).get("message", {}).get("content", [])
 
             if not content_blocks:
                 logger.warning(f"Empty content in vision response (stop_reason={stop_reason})")
-                return []
+                return None
 
             # Find the text block in the response
-            text = ""
             for block in content_blocks:
-                if block.get("type") == "text":
-                    text = block.get("text", "").strip()
+                if "text" in block:
+                    text = block["text"].strip()
                     break
 
             if not text:
                 logger.warning(f"No text in vision response (stop_reason={stop_reason})")
-                return []
+                return None
 
             # Strip markdown code fences if present
-            if text.startswith("```"):
-                text = text.split("\n", 1)[-1] if "\n" in text else text[3:]
-                if text.endswith("```"):
-                    text = text[:-3].strip()
-
-            items = json.loads(text)
-            if isinstance(items, list):
-                return items
-            logger.warning(f"Unexpected vision response format: {type(items)}")
-            return []
+            fenced = _FENCE_RE.match(text)
+            if fenced:
+                text = fenced.group(1).strip()
+
+            return orjson.loads(text)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse vision response as JSON: {e}")
             logger.debug(f"Raw response text: {text[:300] if text else 'EMPTY'}")
-            return []
+            return None
         except Exception as e:
             logger.error(f"Bedrock vision API call failed: {e}")
-            return []
+            return None